@@ -1002,8 +1002,8 @@ const server = new Server(
     }
 );
 
-// Request Handlers
-server.setRequestHandler(ListToolsRequestSchema, async () => ({
+// Tool list is static, so the ListTools response is built once and reused
+const LIST_TOOLS_RESPONSE = {
     tools: [
         SEQUENTIAL_THINKING_TOOL,
         MENTAL_MODEL_TOOL,
@@ -1017,7 +1017,10 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
         STRUCTURED_ARGUMENTATION_TOOL,
         VISUAL_REASONING_TOOL
     ],
-}));
+};
+
+// Request Handlers
+server.setRequestHandler(ListToolsRequestSchema, async () => LIST_TOOLS_RESPONSE);
 
 server.setRequestHandler(CallToolRequestSchema, async (request) => {
     switch (request.params.name) {
@@ -1029,7 +1032,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1040,7 +1043,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1053,7 +1056,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1066,7 +1069,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1079,7 +1082,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1093,7 +1096,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1106,7 +1109,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1120,7 +1123,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1133,7 +1136,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1147,7 +1150,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -1160,7 +1163,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                 content: [
                     {
                         type: "text",
-                        text: JSON.stringify(result, null, 2),
+                        text: JSON.stringify(result),
                     },
                 ],
             };
@@ -83,9 +83,12 @@ export class CollaborativeReasoningServer {
         // Store/update session state
         this.sessions.set(input.sessionId, input);
         
+        // Resolve the next persona once; both the session state and next actions need it
+        const nextPersonaId = input.nextPersonaId || this.suggestNextPersona(input);
+        
         const analysis = this.analyzeCollaboration(input);
-        const sessionState = this.getSessionState(input);
-        const suggestedNextActions = this.generateNextActions(input);
+        const sessionState = this.getSessionState(input, nextPersonaId);
+        const suggestedNextActions = this.generateNextActions(input, nextPersonaId);
         
         return {
             success: true,
@@ -191,13 +194,16 @@ export class CollaborativeReasoningServer {
             consensusScore -= Math.min(disagreements.length * 0.15, 0.4);
         }
         
-        // Adjust based on contribution types
-        const supportiveContributions = input.contributions.filter(c => 
-            c.type === 'insight' || c.type === 'synthesis'
-        ).length;
-        const challengingContributions = input.contributions.filter(c => 
-            c.type === 'challenge' || c.type === 'concern'
-        ).length;
+        // Adjust based on contribution types (counted in one pass, no intermediate arrays)
+        let supportiveContributions = 0;
+        let challengingContributions = 0;
+        input.contributions.forEach(c => {
+            if (c.type === 'insight' || c.type === 'synthesis') {
+                supportiveContributions++;
+            } else if (c.type === 'challenge' || c.type === 'concern') {
+                challengingContributions++;
+            }
+        });
         
         if (totalContributions > 0) {
             const supportRatio = supportiveContributions / totalContributions;
@@ -285,12 +291,12 @@ export class CollaborativeReasoningServer {
         return themes;
     }
 
-    private getSessionState(input: CollaborativeReasoningInput) {
+    private getSessionState(input: CollaborativeReasoningInput, nextPersonaId: string | null) {
         return {
             stage: input.stage,
             iteration: input.iteration,
             activePersonaId: input.activePersonaId,
-            nextPersonaId: input.nextPersonaId || this.suggestNextPersona(input),
+            nextPersonaId,
             consensusPoints: input.consensusPoints || [],
             disagreements: input.disagreements || [],
             keyInsights: input.keyInsights || [],
@@ -335,11 +341,11 @@ export class CollaborativeReasoningServer {
         return expertiseMap[stage] || [];
     }
 
-    private generateNextActions(input: CollaborativeReasoningInput): string[] {
+    private generateNextActions(input: CollaborativeReasoningInput, nextPersonaId: string | null): string[] {
         const actions: string[] = [];
         
         if (input.nextContributionNeeded) {
-            const nextPersona = input.personas.find(p => p.id === (input.nextPersonaId || this.suggestNextPersona(input)));
+            const nextPersona = input.personas.find(p => p.id === nextPersonaId);
             if (nextPersona) {
                 actions.push(`Continue with contribution from ${nextPersona.name} (${nextPersona.expertise.join(', ')})`);
             }
@@ -35,6 +35,16 @@ export interface SequentialThinkingResult {
     timestamp: string;
 }
 
+// Keyword patterns used to classify thoughts. Each is matched case-insensitively
+// in a single scan instead of lowercasing the thought and calling includes() per keyword.
+const INSIGHT_PATTERN = /realize|insight|understand/i;
+const CONNECTION_PATTERN = /connection|relate|link/i;
+const PATTERN_PATTERN = /pattern|trend/i;
+const HYPOTHESIS_PATTERN = /hypothesis|theory|might be/i;
+const CONDITIONAL_IF_PATTERN = /if/i;
+const CONDITIONAL_THEN_PATTERN = /then/i;
+const POSSIBILITY_PATTERN = /could be|possibly|perhaps/i;
+
 interface ThoughtNode {
     id: number;
     thought: string;
@@ -45,8 +55,14 @@ interface ThoughtNode {
     timestamp: string;
 }
 
+interface NodeAnalysis {
+    insights: string[];
+    hypotheses: string[];
+}
+
 export class SequentialThinkingServer {
     private thoughtChains: Map<string, ThoughtNode[]> = new Map();
+    private nodeAnalysisCache: WeakMap<ThoughtNode, NodeAnalysis> = new WeakMap();
     private currentSessionId: string = "default";
 
     processThought(input: SequentialThinkingInput): SequentialThinkingResult {
@@ -99,19 +115,7 @@ export class SequentialThinkingServer {
         
         // Look for insight patterns in thoughts
         thoughtChain.forEach(node => {
-            const thought = node.thought.toLowerCase();
-            
-            if (thought.includes('realize') || thought.includes('insight') || thought.includes('understand')) {
-                insights.push(`Insight from thought ${node.id}: ${this.extractKeyPhrase(node.thought)}`);
-            }
-            
-            if (thought.includes('connection') || thought.includes('relate') || thought.includes('link')) {
-                insights.push(`Connection identified: ${this.extractKeyPhrase(node.thought)}`);
-            }
-            
-            if (thought.includes('pattern') || thought.includes('trend')) {
-                insights.push(`Pattern recognition: ${this.extractKeyPhrase(node.thought)}`);
-            }
+            insights.push(...this.analyzeNode(node).insights);
         });
         
         return insights.length > 0 ? insights : ["Continuing analytical reasoning process"];
@@ -121,28 +125,74 @@ export class SequentialThinkingServer {
         const hypotheses: string[] = [];
         
         thoughtChain.forEach(node => {
-            const thought = node.thought.toLowerCase();
-            
-            if (thought.includes('hypothesis') || thought.includes('theory') || thought.includes('might be')) {
-                hypotheses.push(`Hypothesis from thought ${node.id}: ${this.extractKeyPhrase(node.thought)}`);
-            }
-            
-            if (thought.includes('if') && thought.includes('then')) {
-                hypotheses.push(`Conditional hypothesis: ${this.extractKeyPhrase(node.thought)}`);
-            }
-            
-            if (thought.includes('could be') || thought.includes('possibly') || thought.includes('perhaps')) {
-                hypotheses.push(`Possibility: ${this.extractKeyPhrase(node.thought)}`);
-            }
+            hypotheses.push(...this.analyzeNode(node).hypotheses);
         });
         
         return hypotheses.length > 0 ? hypotheses : ["Building towards hypothesis formation"];
     }
 
+    private analyzeNode(node: ThoughtNode): NodeAnalysis {
+        // Nodes are immutable once added to a chain, so each one is only scanned once
+        const cached = this.nodeAnalysisCache.get(node);
+        if (cached) {
+            return cached;
+        }
+        
+        const thought = node.thought;
+        const insights: string[] = [];
+        const hypotheses: string[] = [];
+        
+        // Extract the key phrase at most once, and only if some pattern matches
+        let phrase: string | undefined;
+        const keyPhrase = () => phrase ??= this.extractKeyPhrase(thought);
+        
+        if (INSIGHT_PATTERN.test(thought)) {
+            insights.push(`Insight from thought ${node.id}: ${keyPhrase()}`);
+        }
+        
+        if (CONNECTION_PATTERN.test(thought)) {
+            insights.push(`Connection identified: ${keyPhrase()}`);
+        }
+        
+        if (PATTERN_PATTERN.test(thought)) {
+            insights.push(`Pattern recognition: ${keyPhrase()}`);
+        }
+        
+        if (HYPOTHESIS_PATTERN.test(thought)) {
+            hypotheses.push(`Hypothesis from thought ${node.id}: ${keyPhrase()}`);
+        }
+        
+        if (CONDITIONAL_IF_PATTERN.test(thought) && CONDITIONAL_THEN_PATTERN.test(thought)) {
+            hypotheses.push(`Conditional hypothesis: ${keyPhrase()}`);
+        }
+        
+        if (POSSIBILITY_PATTERN.test(thought)) {
+            hypotheses.push(`Possibility: ${keyPhrase()}`);
+        }
+        
+        const analysis: NodeAnalysis = { insights, hypotheses };
+        this.nodeAnalysisCache.set(node, analysis);
+        return analysis;
+    }
+
     private extractKeyPhrase(thought: string): string {
-        // Extract the most meaningful part of a thought
-        const sentences = thought.split('.').filter(s => s.trim().length > 0);
-        return sentences[0].trim().substring(0, 100) + (sentences[0].length > 100 ? '...' : '');
+        // Extract the most meaningful part of a thought: the first non-empty sentence.
+        // Scan sentence by sentence instead of splitting the whole thought up front.
+        let sentence = '';
+        let start = 0;
+        while (start <= thought.length) {
+            let end = thought.indexOf('.', start);
+            if (end === -1) {
+                end = thought.length;
+            }
+            const candidate = thought.slice(start, end);
+            if (candidate.trim().length > 0) {
+                sentence = candidate;
+                break;
+            }
+            start = end + 1;
+        }
+        return sentence.trim().substring(0, 100) + (sentence.length > 100 ? '...' : '');
     }
 
     private analyzeThinkingQuality(thoughtChain: ThoughtNode[]): { coherence: number; depth: number; completeness: number } {